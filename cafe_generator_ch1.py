@@ -6,7 +6,7 @@ Python初学者向けの簡潔版
 機能:
 - config.yamlからの設定読み込み
 - 基本的な売上データ生成
-- CSV, JSON, XLSX形式での出力
+- CSV, JSON, XLSX, Parquet形式での出力
 - 一目で分かるデータ構造
 - 詳細な顧客行動パターン
 """
@@ -14,11 +14,101 @@ Python初学者向けの簡潔版
 import yaml
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
 import os
 import json
-from typing import Dict, List, Any, Tuple, Optional, Union, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple
+
+# Excel出力はxlsxwriterがあれば優先して使用（openpyxlより高速・省メモリ）
+try:
+    import xlsxwriter  # noqa: F401
+
+    EXCEL_ENGINE = "xlsxwriter"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+# CSV書き出しはpyarrowがあれば優先して使用（C++実装のためpandasより高速）
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# JSON書き出しはorjsonがあれば優先して使用（Rust実装のため標準のjsonより高速）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# YAMLの読み込みはlibyamlのCローダーがあれば優先して使用（safe_loadと同じ安全な読み込み）
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 売上データの列と, 生成時に確保する配列のデータ型（出力されるDataFrameの列順）
+# 日時は生成中は日時型で保持し, DataFrame作成時にまとめて文字列へ変換する
+# カテゴリ型の列（CATEGORICAL_COLUMNS）は生成中はカテゴリのコードを保持し, DataFrame作成時にカテゴリ型にする
+SALES_COLUMN_DTYPES: Dict[str, Any] = {
+    "注文ID": np.int64,
+    "顧客ID": np.int64,
+    "日時": "datetime64[s]",
+    "日付": object,
+    "時間": np.int32,
+    "曜日": np.int16,
+    "商品ID": np.int64,
+    "商品名": np.int16,
+    "カテゴリ": np.int16,
+    "単価": np.int64,
+    "原価": np.int64,
+    "利益": np.int64,
+    "天気": np.int16,
+    "月": np.int32,
+    "季節": np.int16,
+    "性別": np.int16,
+    "年代": np.int16,
+    "年齢": np.int32,
+    "平日休日": np.int16,
+}
+SALES_COLUMNS: List[str] = list(SALES_COLUMN_DTYPES)
+
+# 天気の種類
+WEATHER_OPTIONS: List[str] = ["sunny", "cloudy", "rainy", "snowy"]
+
+# 性別の種類と日本語表記（同じ並び順）
+GENDER_OPTIONS: List[str] = ["male", "female"]
+GENDER_JAPANESE: List[str] = ["男性", "女性"]
+
+# 値の種類が少なくカテゴリ型で保持する列
+CATEGORICAL_COLUMNS: List[str] = ["曜日", "商品名", "カテゴリ", "天気", "季節", "性別", "年代", "平日休日"]
+
+# 該当する顧客パターンが無い場合のデフォルトパターン (平日全時間帯)
+DEFAULT_CUSTOMER_PATTERN: Dict[str, Any] = {
+    "demographics": {
+        "gender_ratio": {"male": 0.45, "female": 0.55},
+        "age_distribution": {
+            "teens": 0.15,
+            "twenties": 0.35,
+            "thirties": 0.25,
+            "forties": 0.15,
+            "seniors": 0.10,
+        },
+    }
+}
+
+# 曜日の日本語表記（月曜=0, 日曜=6）
+WEEKDAY_JAPANESE: List[str] = ["月", "火", "水", "木", "金", "土", "日"]
+
+# 月ごとの季節の日本語表記（1月=0, 12月=11）
+SEASON_JAPANESE_BY_MONTH: List[str] = ["冬", "冬", "春", "春", "春", "夏", "夏", "夏", "秋", "秋", "秋", "冬"]
+
+# 年代の日本語表記
+AGE_GROUP_JAPANESE: Dict[str, str] = {
+    "teens": "10代",
+    "twenties": "20代",
+    "thirties": "30代",
+    "forties": "40代",
+    "seniors": "50代以上",
+}
 
 
 class CafeDataGenerator:
@@ -32,8 +122,19 @@ class CafeDataGenerator:
             config_path (str, optional): 設定ファイルのパス. Defaults to "config.yaml".
         """
         self.config: Dict[str, Any] = self._load_config(config_path)
+        self.rng: np.random.Generator = np.random.default_rng(self.config["data_generation"].get("random_seed"))
         self.menu_items: List[Dict[str, Any]] = self._prepare_menu_items()
+        self._prepare_menu_arrays()
+        self._item_availability: np.ndarray = self._prepare_item_availability()
         self.customer_patterns: List[Dict[str, Any]] = self._prepare_customer_patterns()
+        self._prepare_age_ranges()
+        self._pattern_lookup: Dict[Tuple[str, int], Dict[str, Any]] = self._prepare_pattern_lookup()
+        self._default_pattern: Dict[str, Any] = self._prepare_pattern(DEFAULT_CUSTOMER_PATTERN)
+        self._preference_weights: np.ndarray = self._prepare_preference_weights()
+        self._item_cdf: np.ndarray = self._prepare_item_cdf()
+        self._prepare_category_codes()
+        self._prepare_traffic_multipliers()
+        self._weather_weights: np.ndarray = self._prepare_weather_weights()
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """
@@ -51,7 +152,7 @@ class CafeDataGenerator:
         """
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=YAML_LOADER)
         except FileNotFoundError:
             print(f"設定ファイル {config_path} が見つかりません")
             raise
@@ -77,7 +178,7 @@ class CafeDataGenerator:
                     "category": categories[item["category_id"]],
                     "price": item["price"],
                     "cost": item["cost"],
-                    "available_hours": item["available_hours"],
+                    "available_hours": frozenset(item["available_hours"]),
                     "popularity": item["popularity_weight"],
                     "is_seasonal": item.get("is_seasonal", False),
                     "seasonal_preference": item.get("seasonal_preference", None),
@@ -86,6 +187,59 @@ class CafeDataGenerator:
             )
         return items
 
+    def _prepare_menu_arrays(self) -> None:
+        """
+        メニューアイテムの属性を配列として準備
+
+        重み計算や売上データの作成をアイテムごとのループではなく配列演算で行えるよう,
+        menu_itemsと同じ並び順の配列で人気度・季節情報・カテゴリ・価格などを保持する
+        """
+        self._seasonal_popularity: np.ndarray = self._prepare_seasonal_popularity()
+        self._category_names: List[str] = [cat["name"] for cat in self.config["menu"]["categories"]]
+        self._item_category_code: np.ndarray = np.array(
+            [self._category_names.index(item["category"]) for item in self.menu_items]
+        )
+
+        # 売上データの列へまとめて書き出すための属性
+        self._item_ids: np.ndarray = np.array([item["id"] for item in self.menu_items])
+        self._item_names: np.ndarray = np.array([item["name"] for item in self.menu_items])
+        self._item_prices: np.ndarray = np.array([item["price"] for item in self.menu_items])
+        self._item_costs: np.ndarray = np.array([item["cost"] for item in self.menu_items])
+
+    def _prepare_seasonal_popularity(self) -> np.ndarray:
+        """
+        月ごとの季節調整済み人気度テーブルを作成
+
+        Returns:
+            np.ndarray: 形状(12, アイテム数)の配列. [月-1, アイテム]で季節調整後の人気度を参照できる
+        """
+        season_map: Dict[str, List[int]] = {
+            "spring": [3, 4, 5],
+            "summer": [6, 7, 8],
+            "autumn": [9, 10, 11],
+            "winter": [12, 1, 2],
+        }
+
+        table: np.ndarray = np.tile(np.array([item["popularity"] for item in self.menu_items], dtype=float), (12, 1))
+        for i, item in enumerate(self.menu_items):
+            if not item["is_seasonal"]:
+                continue
+            for month in season_map.get(item["seasonal_preference"], []):
+                table[month - 1, i] *= item["seasonal_multiplier"]
+
+        return table
+
+    def _prepare_item_availability(self) -> np.ndarray:
+        """
+        時間帯ごとに提供可能なメニューアイテムを事前に判定
+
+        Returns:
+            np.ndarray: 形状(24, アイテム数)の真偽値配列. [時間, アイテム]で提供可能かを参照できる
+        """
+        return np.array(
+            [[hour in item["available_hours"] for item in self.menu_items] for hour in range(24)], dtype=bool
+        )
+
     def _prepare_customer_patterns(self) -> List[Dict[str, Any]]:
         """
         顧客行動パターンを準備
@@ -95,12 +249,157 @@ class CafeDataGenerator:
         """
         return self.config["customers"]["behavioral_patterns"]
 
-    def _get_customer_pattern(self, date: datetime, hour: int) -> Dict[str, Any]:
+    def _prepare_pattern_lookup(self) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """
+        曜日区分と時間から顧客パターンを直接引ける辞書を作成
+
+        条件に複数のパターンが当てはまる場合は, 設定で先に書かれたパターンを優先する
+
+        Returns:
+            Dict[Tuple[str, int], Dict[str, Any]]: ("weekday"または"weekend", 時間)をキーとした,
+                _prepare_patternで準備済みの顧客パターン
+        """
+        lookup: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for pattern in self.customer_patterns:
+            prepared: Dict[str, Any] = self._prepare_pattern(pattern)
+            conditions = pattern["conditions"]
+            for day_type in conditions["day_types"]:
+                for hour in conditions["hours"]:
+                    lookup.setdefault((day_type, hour), prepared)
+        return lookup
+
+    def _prepare_pattern(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        顧客パターンに属性の抽選に使う確率の配列を追加
+
+        顧客の属性を生成するたびに設定の辞書から確率のリストを作り直さないよう,
+        性別・年代の確率と年代のインデックスを配列として持たせる
+
+        Args:
+            pattern (Dict[str, Any]): 顧客パターンの辞書
+
+        Returns:
+            Dict[str, Any]: "distribution"キーに確率の配列を追加した顧客パターンの辞書（元の辞書は変更しない）
+        """
+        demographics: Dict[str, Any] = pattern["demographics"]
+        age_distribution: Dict[str, float] = demographics["age_distribution"]
+
+        distribution: Dict[str, np.ndarray] = {
+            "gender_probabilities": np.array(
+                [demographics["gender_ratio"][gender] for gender in GENDER_OPTIONS], dtype=float
+            ),
+            "age_group_index": np.array([self._age_group_index[ag] for ag in age_distribution]),
+            "age_probabilities": np.array(list(age_distribution.values()), dtype=float),
+        }
+        return {**pattern, "distribution": distribution}
+
+    def _prepare_age_ranges(self) -> None:
+        """
+        年代ごとの年齢範囲を配列として準備
+
+        年代名・最小年齢・最大年齢を同じ並び順の配列で保持し,
+        顧客生成時に年代のインデックスでまとめて参照できるようにする
+        """
+        age_config: List[Dict[str, Any]] = self.config["customers"]["age_groups"]
+        self._age_group_names: np.ndarray = np.array([ag["name"] for ag in age_config])
+        self._age_min: np.ndarray = np.array([ag["min_age"] for ag in age_config])
+        self._age_max: np.ndarray = np.array([ag["max_age"] for ag in age_config])
+        self._age_group_index: Dict[str, int] = {ag["name"]: i for i, ag in enumerate(age_config)}
+        self._age_group_japanese: np.ndarray = np.array(
+            [self._convert_age_group_japanese(name) for name in self._age_group_names]
+        )
+
+    def _prepare_preference_weights(self) -> np.ndarray:
+        """
+        性別・年代ごとの商品の嗜好度合いをテーブルとして準備
+
+        Returns:
+            np.ndarray: 形状(性別数, 年代数, アイテム数)の配列. [性別, 年代, アイテム]で
+                アイテムのカテゴリに対する嗜好度合いを参照できる
+        """
+        table: np.ndarray = np.ones((len(GENDER_OPTIONS), len(self._age_group_names), len(self.menu_items)))
+        for g, gender in enumerate(GENDER_OPTIONS):
+            for a, age_group in enumerate(self._age_group_names):
+                preferences: Dict[str, float] = self._get_customer_preferences(gender, str(age_group))
+                category_preference: np.ndarray = np.array([preferences.get(cat, 1.0) for cat in self._category_names])
+                table[g, a] = category_preference[self._item_category_code]
+        return table
+
+    def _prepare_item_cdf(self) -> np.ndarray:
+        """
+        月・時間帯・性別・年代ごとの商品の累積確率をテーブルとして準備
+
+        提供時間・季節調整後の人気度・顧客の嗜好は月・時間帯・性別・年代だけで決まるため,
+        初期化時に一度だけまとめて計算し, 日ごと・顧客ごとに重みを作り直さないようにする
+
+        Returns:
+            np.ndarray: 形状(12, 24, 性別数, 年代数, アイテム数)の配列. [月-1, 時間, 性別, 年代]で
+                最後の軸に沿った累積確率を参照でき, 末尾がちょうど1になる（提供できる商品が無い組み合わせは全て0）
+        """
+        weights: np.ndarray = (
+            self._seasonal_popularity[:, None, None, None, :]
+            * self._item_availability[None, :, None, None, :]
+            * self._preference_weights[None, None, :, :, :]
+        )
+        cumulative: np.ndarray = np.cumsum(weights, axis=-1)
+        totals: np.ndarray = cumulative[..., -1:]
+        return np.divide(cumulative, totals, out=np.zeros_like(cumulative), where=totals > 0)
+
+    def _prepare_category_codes(self) -> None:
+        """
+        カテゴリ型の列のカテゴリとコードの対応表を準備
+
+        各列の値の元になるインデックス（曜日・アイテム・カテゴリ・天気・月-1・性別・年代・曜日）から
+        カテゴリのコードを引ける配列を作り, 生成中は文字列ではなくコードを書き込めるようにする.
+        カテゴリは文字列から変換した場合と同じく値の昇順に並べる
+        """
+        source_labels: Dict[str, List[str]] = {
+            "曜日": WEEKDAY_JAPANESE,
+            "商品名": list(self._item_names),
+            "カテゴリ": self._category_names,
+            "天気": WEATHER_OPTIONS,
+            "季節": SEASON_JAPANESE_BY_MONTH,
+            "性別": GENDER_JAPANESE,
+            "年代": list(self._age_group_japanese),
+            "平日休日": ["平日" if weekday < 5 else "休日" for weekday in range(7)],
+        }
+
+        self._category_dtypes: Dict[str, pd.CategoricalDtype] = {}
+        self._category_codes: Dict[str, np.ndarray] = {}
+        for column, labels in source_labels.items():
+            categories, codes = np.unique(np.array(labels), return_inverse=True)
+            self._category_dtypes[column] = pd.CategoricalDtype(categories)
+            self._category_codes[column] = codes.astype(np.int16)
+
+    def _prepare_traffic_multipliers(self) -> None:
+        """
+        来客数計算に使う各種係数を配列として準備
+
+        設定の辞書を時間帯・日ごとに参照し直さないよう,
+        曜日・時間帯・月・天気の係数をインデックスで引ける配列にしておく
+        """
+        generation_config: Dict[str, Any] = self.config["data_generation"]
+        # 曜日係数はYAMLでは整数キーとして読み込まれるため, 整数キーを優先し文字列キーにも対応する
+        self._weekday_multiplier: np.ndarray = np.array(
+            [generation_config.get(weekday, generation_config.get(str(weekday), 1.0)) for weekday in range(7)],
+            dtype=float,
+        )
+        self._hour_multiplier: np.ndarray = np.array(
+            [generation_config["hour_multiplier"].get(hour, 1.0) for hour in range(24)], dtype=float
+        )
+        self._month_multiplier: np.ndarray = np.array(
+            [generation_config["seasonal_multiplier"].get(month, 1.0) for month in range(13)], dtype=float
+        )
+        self._weather_multiplier: np.ndarray = np.array(
+            [generation_config["weather_multiplier"].get(weather, 1.0) for weather in WEATHER_OPTIONS], dtype=float
+        )
+
+    def _get_customer_pattern(self, date: pd.Timestamp, hour: int) -> Dict[str, Any]:
         """
         日時に基づいて顧客パターンを決定
 
         Args:
-            date (datetime): 対象の日付
+            date (pd.Timestamp): 対象の日付
             hour (int): 対象の時間(0-23)
 
         Returns:
@@ -109,56 +408,37 @@ class CafeDataGenerator:
         is_weekend: bool = date.weekday() >= 5
         day_type = "weekend" if is_weekend else "weekday"
 
-        # 該当するパターンを検索
-        for pattern in self.customer_patterns:
-            conditions = pattern["conditions"]
-            if day_type in conditions["day_types"] and hour in conditions["hours"]:
-                return pattern
-
-        # デフォルトパターン (平日全時間帯)
-        return {
-            "demographics": {
-                "gender_ratio": {"male": 0.45, "female": 0.55},
-                "age_distribution": {
-                    "teens": 0.15,
-                    "twenties": 0.35,
-                    "thirties": 0.25,
-                    "forties": 0.15,
-                    "seniors": 0.10,
-                },
-            }
-        }
+        # 該当するパターンを検索（無ければデフォルトパターン）
+        return self._pattern_lookup.get((day_type, hour), self._default_pattern)
 
-    def _generate_customer_demographics(self, pattern: Dict[str, Any]) -> Dict[str, Union[str, int]]:
+    def _generate_customer_demographics(self, pattern: Dict[str, Any], size: int) -> Dict[str, np.ndarray]:
         """
-        顧客の性別・年代を生成
+        顧客の性別・年代をまとめて生成
 
         Args:
-            pattern (Dict[str, Any]): 顧客パターンの辞書
+            pattern (Dict[str, Any]): _prepare_patternで準備済みの顧客パターンの辞書
+            size (int): 生成する顧客数
 
         Returns:
-            Dict[str, Union[str, int]]: 顧客の属性情報(性別, 年代, 年齢)
+            Dict[str, np.ndarray]: 顧客の属性情報の配列. 性別はGENDER_OPTIONS, 年代は年代設定の並び順のインデックス
         """
-        demographics: Dict[str, Any] = pattern["demographics"]
+        distribution: Dict[str, np.ndarray] = pattern["distribution"]
 
-        # 性別決定
-        gender = np.random.choice(
-            ["male", "female"], p=[demographics["gender_ratio"]["male"], demographics["gender_ratio"]["female"]]
-        )
+        # 性別決定（GENDER_OPTIONSのインデックスで選択）
+        gender_idx: np.ndarray = self.rng.choice(len(GENDER_OPTIONS), size=size, p=distribution["gender_probabilities"])
 
-        # 年代決定
-        age_groups: List[str] = list(demographics["age_distribution"].keys())
-        age_probabilities: List[float] = list(demographics["age_distribution"].values())
-        age_group: str = np.random.choice(age_groups, p=age_probabilities)
+        # 年代決定（年齢範囲の配列を参照するためインデックスで選択）
+        group_index: np.ndarray = distribution["age_group_index"]
+        age_group_idx: np.ndarray = group_index[
+            self.rng.choice(len(group_index), size=size, p=distribution["age_probabilities"])
+        ]
 
         # 具体的な年齢を生成
-        age_config: List[Dict[str, Any]] = self.config["customers"]["age_groups"]
-        age_range: Dict[str, Any] = next(ag for ag in age_config if ag["name"] == age_group)
-        age: int = np.random.randint(age_range["min_age"], age_range["max_age"] + 1)
+        age: np.ndarray = self.rng.integers(self._age_min[age_group_idx], self._age_max[age_group_idx] + 1)
 
         return {
-            "gender": gender,
-            "age_group": age_group,
+            "gender": gender_idx,
+            "age_group": age_group_idx,
             "age": age,
         }
 
@@ -186,127 +466,75 @@ class CafeDataGenerator:
                 "スイーツ": 1.0,
             }
 
-    def _get_weather_for_date(self, date: datetime) -> str:
+    def _prepare_weather_weights(self) -> np.ndarray:
         """
-        日付に基づいて天気を決定
-
-        Args:
-            date (datetime): 対象の日付
+        月ごとの天気の出やすさを表すテーブルを作成
 
         Returns:
-            str: 天気の文字列（"sunny", "cloudy", "rainy", "snowy"）
+            np.ndarray: 形状(12, 天気の種類数)の配列. [月-1]でWEATHER_OPTIONSの順の確率を参照できる
         """
-        # 将来的には天気APIを使用
-        weather_options: List[str] = ["sunny", "cloudy", "rainy", "snowy"]
-        weights: List[float] = [0.4, 0.3, 0.2, 0.1]  # 晴れが多め
+        table: np.ndarray = np.tile([0.4, 0.3, 0.2, 0.1], (12, 1))  # 晴れが多め
 
         # 季節による調整
-        if date.month in [12, 1, 2]:
-            weights = [0.25, 0.35, 0.2, 0.2]  # 冬
-        elif date.month in [6, 7, 8]:
-            weights = [0.6, 0.25, 0.15, 0.00]  # 夏
+        table[[11, 0, 1]] = [0.25, 0.35, 0.2, 0.2]  # 冬
+        table[[5, 6, 7]] = [0.6, 0.25, 0.15, 0.00]  # 夏
 
-        return np.random.choice(weather_options, p=weights)
+        return table
 
-    def _apply_seasonal_adjustment(self, item: Dict[str, Any], date: datetime) -> float:
+    def _get_weather_for_dates(self, months: np.ndarray) -> np.ndarray:
         """
-        季節調整を適用
+        日付ごとの月に基づいて天気をまとめて決定
 
         Args:
-            item (Dict[str, Any]): メニューアイテムの辞書
-            date (datetime): 対象の日付
+            months (np.ndarray): 対象の日付ごとの月(1-12)
 
         Returns:
-            float: 季節調整後の人気度
+            np.ndarray: 日付ごとの天気のWEATHER_OPTIONSでのインデックス
         """
-        if not item["is_seasonal"]:
-            return item["popularity"]
-
-        season_map: Dict[str, List[int]] = {
-            "spring": [3, 4, 5],
-            "summer": [6, 7, 8],
-            "autumn": [9, 10, 11],
-            "winter": [12, 1, 2],
-        }
-
-        current_season: Optional[str] = None
-        for season, months in season_map.items():
-            if date.month in months:
-                current_season = season
-                break
-
-        if current_season == item["seasonal_preference"]:
-            return item["popularity"] * item["seasonal_multiplier"]
-
-        return item["popularity"]
-
-    def _calculate_hourly_customers(self, date: datetime, hour: int) -> int:
+        # 将来的には天気APIを使用
+        # 月ごとの累積確率と一様乱数を比べ, 乱数以下の累積確率の個数を天気のインデックスとする（逆関数法）
+        cdf: np.ndarray = np.cumsum(self._weather_weights, axis=1)
+        cdf /= cdf[:, -1:]
+        return (self.rng.random(len(months))[:, None] >= cdf[months - 1]).sum(axis=1)
+
+    def _calculate_daily_multipliers(
+        self, weekdays: np.ndarray, months: np.ndarray, weathers: np.ndarray
+    ) -> np.ndarray:
         """
-        時間帯別の来客数を計算
+        営業日ごとに日単位で決まる来客数の係数をまとめて計算
 
         Args:
-            date (datetime): 対象の日付
-            hour (int): 対象の時間(0-23)
+            weekdays (np.ndarray): 営業日ごとの曜日（月曜=0, 日曜=6）
+            months (np.ndarray): 営業日ごとの月(1-12)
+            weathers (np.ndarray): 営業日ごとの天気のWEATHER_OPTIONSでのインデックス
 
         Returns:
-            int: 予想来客数
+            np.ndarray: 営業日ごとの, 基本来客数に曜日係数・季節係数・天気係数を掛けた値
         """
         base_customers: int = self.config["data_generation"]["base_customers_per_hour"]
 
-        # 曜日係数（月曜=0, 日曜=6）
-        weekday: int = date.weekday()
-        day_multiplier: float = self.config["data_generation"].get(str(weekday), 1.0)
-
-        # 時間帯係数
-        hour_multiplier: float = self.config["data_generation"]["hour_multiplier"].get(hour, 1.0)
+        # 曜日係数と季節係数
+        multipliers: np.ndarray = base_customers * self._weekday_multiplier[weekdays] * self._month_multiplier[months]
 
         # 天気係数
-        weather: str = self._get_weather_for_date(date)
-        weather_multiplier: float = self.config["data_generation"]["weather_multiplier"].get(weather, 1.0)
-
-        # 季節係数
-        seasonal_multiplier: float = self.config["data_generation"]["seasonal_multiplier"].get(date.month, 1.0)
-
-        # 最終来客数計算
-        customers: float = base_customers * day_multiplier * hour_multiplier * weather_multiplier * seasonal_multiplier
-
-        # ポアソン分布でランダム性を追加
-        return max(0, np.random.poisson(customers))
+        return multipliers * self._weather_multiplier[weathers]
 
-    def _select_menu_items_with_preferences(
-        self, hour: int, customer_demographics: Dict[str, Union[str, int]], date: datetime
-    ) -> Tuple[List[Dict[str, Any]], List[float]]:
+    def _calculate_hourly_customers(self, daily_multipliers: np.ndarray, hours: np.ndarray) -> np.ndarray:
         """
-        顧客の嗜好を考慮してメニューアイテムを選択
+        営業日・営業時間ごとの来客数をまとめて計算
 
         Args:
-            hour (int): 時間 (0-23)
-            customer_demographics (Dict[str, Union[str, int]]): 顧客の属性情報
-            date (datetime): 対象の日付
+            daily_multipliers (np.ndarray): 営業日ごとの_calculate_daily_multipliersで求めた係数
+            hours (np.ndarray): 営業時間(0-23)の配列
 
         Returns:
-            Tuple[List[Dict[str, Any]], List[float]]: 利用可能なアイテムのリストと, それぞれの重み
+            np.ndarray: 形状(営業日数, 営業時間数)の予想来客数
         """
-        available_items: List[Dict[str, Any]] = [item for item in self.menu_items if hour in item["available_hours"]]
+        # 最終来客数計算（日単位の係数と時間帯係数の外積）
+        expected: np.ndarray = daily_multipliers[:, None] * self._hour_multiplier[hours][None, :]
 
-        if not available_items:
-            return [], []
-
-        # 顧客の嗜好を取得
-        preferences: Dict[str, float] = self._get_customer_preferences(
-            str(customer_demographics["gender"]),
-            str(customer_demographics["age_group"]),
-        )
-
-        # 人気度に基づいて重み付け選択
-        weights: List[float] = []
-        for item in available_items:
-            base_weight = self._apply_seasonal_adjustment(item, date)
-            category_preference = preferences.get(item["category"], 1.0)
-            final_weight = base_weight * category_preference
-            weights.append(final_weight)
-
-        return available_items, weights
+        # ポアソン分布でランダム性を追加（全ての日・時間帯を1回で抽選）
+        return self.rng.poisson(expected)
 
     def generate_sales_data(self) -> pd.DataFrame:
         """
@@ -315,140 +543,213 @@ class CafeDataGenerator:
         Returns:
             pd.DataFrame: 売上データを含むDataFrame
         """
-        start_date: datetime = datetime.strptime(self.config["data_generation"]["start_date"], "%Y-%m-%d")
-        end_date: datetime = datetime.strptime(self.config["data_generation"]["end_date"], "%Y-%m-%d")
+        start_date: pd.Timestamp = pd.Timestamp(self.config["data_generation"]["start_date"])
+        end_date: pd.Timestamp = pd.Timestamp(self.config["data_generation"]["end_date"])
 
         business_hours: Dict[str, Any] = self.config["data_generation"]["business_hours"]
         open_hour: int = business_hours["open"]
         close_hour: int = business_hours["close"]
         closed_days: List[int] = business_hours["closed_days"]
 
-        sales_data: List[Dict[str, Any]] = []
+        # 列ごとに型付きの配列を確保し, 時間帯ごとの注文データを書き込み位置から順に詰めていく
+        # （利益は単価と原価の列からまとめて計算するため除く）
+        capacity: int = self._estimate_sales_rows(start_date, end_date, close_hour - open_hour)
+        sales_buffers: Dict[str, np.ndarray] = {
+            column: np.empty(capacity, dtype=dtype) for column, dtype in SALES_COLUMN_DTYPES.items() if column != "利益"
+        }
+        row: int = 0
         customer_id_counter: int = self.config["data_generation"]["id_generation"]["customer_id_start"]
         order_id_counter: int = self.config["data_generation"]["id_generation"]["order_id_start"]
 
-        current_date: datetime = start_date
-        while current_date <= end_date:
-            # 定休日チェック
-            if current_date.weekday() in closed_days:
-                current_date += timedelta(days=1)
-                continue
+        # 期間内の日付から定休日を除いた営業日を求め, 曜日・月・日付文字列を配列でまとめて用意する
+        dates: pd.DatetimeIndex = pd.date_range(start_date, end_date, freq="D")
+        business_dates: pd.DatetimeIndex = dates[~np.isin(dates.weekday, closed_days)]
+        weekdays: np.ndarray = business_dates.weekday.to_numpy()
+        months: np.ndarray = business_dates.month.to_numpy()
+        date_strings: np.ndarray = business_dates.strftime("%Y-%m-%d").to_numpy()
 
-            # 営業時間内の売上生成
-            for hour in range(open_hour, close_hour):
-                customers = self._calculate_hourly_customers(current_date, hour)
+        # 天気と日単位の係数・来客数を先に決めておく
+        weathers: np.ndarray = self._get_weather_for_dates(months)
+        daily_multipliers: np.ndarray = self._calculate_daily_multipliers(weekdays, months, weathers)
+        hours: np.ndarray = np.arange(open_hour, close_hour)
+        customers_matrix: np.ndarray = self._calculate_hourly_customers(daily_multipliers, hours)
+
+        for day, current_date in enumerate(business_dates):
+            # 商品の累積確率はその月の分を参照する
+            item_cdf: np.ndarray = self._item_cdf[months[day] - 1]
 
+            # 営業時間内の売上生成
+            day_start: int = row
+            for hour, customers in zip(hours, customers_matrix[day]):
                 if customers == 0:
                     continue
 
-                # 時間帯の顧客パターンを取得
-                customer_pattern: Dict[str, Any] = self._get_customer_pattern(current_date, hour)
-
-                # 各顧客の注文を生成
-                for customer in range(customers):
-                    # 顧客の属性を生成
-                    customer_demographics: Dict[str, Union[str, int]] = self._generate_customer_demographics(
-                        customer_pattern
-                    )
-
-                    available_items, weights = self._select_menu_items_with_preferences(
-                        hour, customer_demographics, current_date
-                    )
-
-                    if not available_items:
-                        continue
-
-                    # 1人あたりの注文数（1-3個）
-                    num_orders: int = np.random.choice([1, 2, 3], p=[0.6, 0.3, 0.1])
-
-                    customer_orders: List[Dict[str, Any]] = []
-                    for _ in range(num_orders):
-                        # 人気度に基づいて商品選択
-                        if weights and sum(weights) > 0:
-                            normalized_weights: np.ndarray = np.array(weights) / np.sum(weights)
-                            selected_index: int = np.random.choice(len(available_items), p=normalized_weights)
-                            selected_item: Dict[str, Any] = available_items[selected_index]
-                            customer_orders.append(selected_item)
-
-                    # 注文データを記録
-                    order_timestamp: datetime = current_date.replace(
-                        hour=hour,
-                        minute=np.random.randint(0, 60),
-                        second=np.random.randint(0, 60),
-                    )
-
-                    current_customer_id: int = customer_id_counter
-                    current_order_id: int = order_id_counter
-
-                    for item in customer_orders:
-                        sales_data.append(
-                            {
-                                "注文ID": current_order_id,
-                                "顧客ID": current_customer_id,
-                                "日時": order_timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                                "日付": current_date.strftime("%Y-%m-%d"),
-                                "時間": hour,
-                                "曜日": ["月", "火", "水", "木", "金", "土", "日"][current_date.weekday()],
-                                "商品ID": item["id"],
-                                "商品名": item["name"],
-                                "カテゴリ": item["category"],
-                                "単価": item["price"],
-                                "原価": item["cost"],
-                                "利益": item["price"] - item["cost"],
-                                "天気": self._get_weather_for_date(current_date),
-                                "月": current_date.month,
-                                "季節": self._get_season(current_date.month),
-                                "性別": "男性" if customer_demographics["gender"] == "male" else "女性",
-                                "年代": self._convert_age_group_japanese(str(customer_demographics["age_group"])),
-                                "年齢": customer_demographics["age"],
-                                "平日休日": "平日" if current_date.weekday() < 5 else "休日",
-                            }
-                        )
-
-                    customer_id_counter += 1
-                    order_id_counter += 1
-
-            current_date += timedelta(days=1)
-
-        return pd.DataFrame(sales_data)
+                hourly_sales, served = self._generate_hourly_sales(
+                    current_date,
+                    hour,
+                    item_cdf[hour],
+                    int(customers),
+                    customer_id_counter,
+                    order_id_counter,
+                )
+                rows: int = len(hourly_sales["注文ID"]) if hourly_sales else 0
+
+                # 確保した配列が足りなくなったら倍のサイズに拡張（拡張回数をlog回に抑える）
+                if row + rows > capacity:
+                    capacity = max(capacity * 2, row + rows)
+                    for column, buffer in sales_buffers.items():
+                        expanded: np.ndarray = np.empty(capacity, dtype=buffer.dtype)
+                        expanded[:row] = buffer[:row]
+                        sales_buffers[column] = expanded
+
+                for column, values in hourly_sales.items():
+                    sales_buffers[column][row : row + rows] = values
+                row += rows
+
+                customer_id_counter += served
+                order_id_counter += served
+
+            # 日付で決まる列は時間帯ごとに作らず, その日の明細へまとめて書き込む
+            date_values: Dict[str, Any] = {
+                "日付": date_strings[day],
+                "曜日": self._category_codes["曜日"][weekdays[day]],
+                "天気": self._category_codes["天気"][weathers[day]],
+                "月": months[day],
+                "季節": self._category_codes["季節"][months[day] - 1],
+                "平日休日": self._category_codes["平日休日"][weekdays[day]],
+            }
+            for column, value in date_values.items():
+                sales_buffers[column][day_start:row] = value
+
+        df = pd.DataFrame({column: buffer[:row] for column, buffer in sales_buffers.items()})
+        # 日時は"YYYY-MM-DDTHH:MM:SS"の文字列にしてから区切りの"T"を空白に置き換える
+        # （np.char.replaceは空の配列を扱えないため, 営業日が無い場合はそのまま使う）
+        timestamps: np.ndarray = np.datetime_as_string(sales_buffers["日時"][:row], unit="s")
+        df["日時"] = np.char.replace(timestamps, "T", " ") if row > 0 else timestamps
+        df.insert(SALES_COLUMNS.index("利益"), "利益", df["単価"] - df["原価"])
+
+        # 同じ文字列が繰り返される列はカテゴリ型にしてメモリ使用量を抑え, 集計を高速化
+        # （書き込んだコードからそのまま作成し, 出現しないカテゴリは除く）
+        for column in CATEGORICAL_COLUMNS:
+            df[column] = pd.Categorical.from_codes(
+                df[column], dtype=self._category_dtypes[column]
+            ).remove_unused_categories()
+
+        return df
+
+    def _estimate_sales_rows(self, start_date: pd.Timestamp, end_date: pd.Timestamp, business_hours: int) -> int:
+        """
+        売上データの行数の目安を見積もる
+
+        Args:
+            start_date (pd.Timestamp): 開始日
+            end_date (pd.Timestamp): 終了日
+            business_hours (int): 1日の営業時間数
 
-    def _convert_age_group_japanese(self, age_group: str) -> str:
+        Returns:
+            int: 配列を最初に確保する行数（1人あたり平均注文数と係数の変動を見込んだ多めの値）
         """
-        年代を日本語に変換
+        days: int = (end_date - start_date).days + 1
+        base_customers: int = self.config["data_generation"]["base_customers_per_hour"]
+        return max(1, int(days * business_hours * base_customers * 2))
+
+    def _generate_hourly_sales(
+        self,
+        date: pd.Timestamp,
+        hour: int,
+        item_cdf: np.ndarray,
+        customers: int,
+        customer_id_start: int,
+        order_id_start: int,
+    ) -> Tuple[Dict[str, np.ndarray], int]:
+        """
+        1時間分の来客の注文データをまとめて生成
+
+        顧客ごとにループせず, 属性・注文数・商品を配列単位で一度に抽選する
 
         Args:
-            age_group (str): 英語の年代表記
+            date (pd.Timestamp): 対象の日付
+            hour (int): 対象の時間(0-23)
+            item_cdf (np.ndarray): 形状(性別数, 年代数, アイテム数)の, この時間帯の商品の累積確率
+            customers (int): 来客数
+            customer_id_start (int): この時間帯で最初に割り当てる顧客ID
+            order_id_start (int): この時間帯で最初に割り当てる注文ID
 
         Returns:
-            str: 日本語の年代表記
+            Tuple[Dict[str, np.ndarray], int]: 列名をキーとした注文データの配列と, IDを割り当てた顧客数
         """
-        conversion: Dict[str, str] = {
-            "teens": "10代",
-            "twenties": "20代",
-            "thirties": "30代",
-            "forties": "40代",
-            "seniors": "50代以上",
+        # 提供できる商品が無い時間帯は来客を記録しない
+        if not self._item_availability[hour].any():
+            return {}, 0
+
+        # 時間帯の顧客パターンを取得
+        customer_pattern: Dict[str, Any] = self._get_customer_pattern(date, hour)
+
+        # 時間帯の顧客属性をまとめて生成
+        demographics: Dict[str, np.ndarray] = self._generate_customer_demographics(customer_pattern, customers)
+
+        # 1人あたりの注文数（1-3個）と来店時刻（分・秒）をまとめて生成
+        num_orders_list: np.ndarray = self.rng.choice([1, 2, 3], size=customers, p=[0.6, 0.3, 0.1])
+        minutes: np.ndarray = self.rng.integers(0, 60, size=customers)
+        seconds: np.ndarray = self.rng.integers(0, 60, size=customers)
+
+        # 注文明細1行ごとに, 注文した顧客（この時間帯での通し番号）を対応付ける
+        order_customer: np.ndarray = np.repeat(np.arange(customers), num_orders_list)
+        order_items: np.ndarray = np.full(len(order_customer), -1)
+
+        # 明細ごとの一様乱数をまとめて引き, 性別・年代グループの累積確率から逆関数法で商品を選択
+        # （累積確率が同じ値の商品は確率0なので, side="right"で次の商品に進める）
+        uniform: np.ndarray = self.rng.random(len(order_customer))
+        order_gender: np.ndarray = demographics["gender"][order_customer]
+        order_age_group: np.ndarray = demographics["age_group"][order_customer]
+        for gender in np.unique(order_gender):
+            for age_group in np.unique(order_age_group[order_gender == gender]):
+                in_group: np.ndarray = (order_gender == gender) & (order_age_group == age_group)
+                cdf: np.ndarray = item_cdf[gender, age_group]
+                if cdf[-1] > 0:
+                    order_items[in_group] = np.searchsorted(cdf, uniform[in_group], side="right")
+
+        # 商品が選ばれなかった明細を除く
+        ordered: np.ndarray = order_items >= 0
+        order_customer = order_customer[ordered]
+        order_items = order_items[ordered]
+        rows: int = len(order_items)
+
+        # 注文データを記録（来店時刻はその日の0時からの経過秒数を足して日時型でまとめて作成）
+        order_timestamps: np.ndarray = np.datetime64(date, "s") + (hour * 3600 + minutes * 60 + seconds).astype(
+            "timedelta64[s]"
+        )
+        gender_codes: np.ndarray = self._category_codes["性別"][demographics["gender"]]
+        age_group_codes: np.ndarray = self._category_codes["年代"][demographics["age_group"]]
+
+        hourly_sales: Dict[str, np.ndarray] = {
+            "注文ID": order_id_start + order_customer,
+            "顧客ID": customer_id_start + order_customer,
+            "日時": order_timestamps[order_customer],
+            "時間": np.full(rows, hour),
+            "商品ID": self._item_ids[order_items],
+            "商品名": self._category_codes["商品名"][order_items],
+            "カテゴリ": self._category_codes["カテゴリ"][self._item_category_code[order_items]],
+            "単価": self._item_prices[order_items],
+            "原価": self._item_costs[order_items],
+            "性別": gender_codes[order_customer],
+            "年代": age_group_codes[order_customer],
+            "年齢": demographics["age"][order_customer],
         }
-        return conversion.get(age_group, "不明")
 
-    def _get_season(self, month: int) -> str:
+        return hourly_sales, customers
+
+    def _convert_age_group_japanese(self, age_group: str) -> str:
         """
-        月から季節を判定
+        年代を日本語に変換
 
         Args:
-            month (int): 月 (1-12)
+            age_group (str): 英語の年代表記
 
         Returns:
-            str: 季節の日本語表記
-        """
-        if month in [3, 4, 5]:
-            return "春"
-        elif month in [6, 7, 8]:
-            return "夏"
-        elif month in [9, 10, 11]:
-            return "秋"
-        else:
-            return "冬"
+            str: 日本語の年代表記
+        """
+        return AGE_GROUP_JAPANESE.get(age_group, "不明")
 
     def save_data(self, df: pd.DataFrame, output_dir: str = "data") -> None:
         """
@@ -460,25 +761,45 @@ class CafeDataGenerator:
         """
         os.makedirs(output_dir, exist_ok=True)
 
-        # CSV形式
-        self._save_csv(df, output_dir)
+        # 集計データは各形式で共通なので, 書き出し前に一度だけ作成する
+        summaries: Dict[str, pd.DataFrame] = self._create_summaries(df)
 
-        # JSON形式
-        self._save_json(df, output_dir)
-
-        # XLSX形式
-        self._save_xlsx(df, output_dir)
+        # CSV, JSON, XLSX, Parquet形式
+        # 各形式の書き出しは互いに独立しているため, スレッドで並行して実行する
+        savers = [self._save_csv, self._save_json, self._save_xlsx, self._save_parquet]
+        with ThreadPoolExecutor(max_workers=min(len(savers), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(saver, df, summaries, output_dir) for saver in savers]
+            for future in futures:
+                future.result()
 
         print(f"\n💾 データ保存完了:")
         print(f"  📁 保存先: {output_dir}")
-        print(f"  📄 形式: CSV, JSON, XLSX")
+        print(f"  📄 形式: CSV, JSON, XLSX, Parquet")
+
+    def _create_summaries(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        保存する集計データをまとめて作成
+
+        Args:
+            df (pd.DataFrame): 元の売上データ
 
-    def _save_csv(self, df: pd.DataFrame, output_dir: str) -> None:
+        Returns:
+            Dict[str, pd.DataFrame]: 集計名をキーとした集計データ
+        """
+        return {
+            "daily_summary": self._create_daily_summary(df),
+            "product_summary": self._create_product_summary(df),
+            "customer_summary": self._create_customer_summary(df),
+            "demographic_analysis": self._create_demographic_analysis(df),
+        }
+
+    def _save_csv(self, df: pd.DataFrame, summaries: Dict[str, pd.DataFrame], output_dir: str) -> None:
         """
         CSV形式で保存
 
         Args:
             df (pd.DataFrame): 保存するDataFrame
+            summaries (Dict[str, pd.DataFrame]): _create_summariesで作成した集計データ
             output_dir (str): 出力ディレクトリ
         """
         csv_dir = os.path.join(output_dir, "csv")
@@ -486,31 +807,45 @@ class CafeDataGenerator:
 
         # メイン売上データ
         main_file = os.path.join(csv_dir, "cafe_sales_data.csv")
-        df.to_csv(main_file, index=False, encoding="utf-8")
+        self._write_csv(df, main_file)
 
         # 日別集計データ
-        daily_summary = self._create_daily_summary(df)
         daily_file = os.path.join(csv_dir, "daily_summary.csv")
-        daily_summary.to_csv(daily_file, index=False, encoding="utf-8")
+        summaries["daily_summary"].to_csv(daily_file, index=False, encoding="utf-8")
 
         # 商品別集計データ
-        product_summary = self._create_product_summary(df)
         product_file = os.path.join(csv_dir, "product_summary.csv")
-        product_summary.to_csv(product_file, index=False, encoding="utf-8")
+        summaries["product_summary"].to_csv(product_file, index=False, encoding="utf-8")
 
         # 顧客分析データ
-        customer_summary = self._create_customer_summary(df)
         customer_file = os.path.join(csv_dir, "customer_summary.csv")
-        customer_summary.to_csv(customer_file, index=False, encoding="utf-8")
+        summaries["customer_summary"].to_csv(customer_file, index=False, encoding="utf-8")
 
         print(f"  ✅ CSV保存完了: {csv_dir}")
 
-    def _save_json(self, df: pd.DataFrame, output_dir: str) -> None:
+    def _write_csv(self, df: pd.DataFrame, file_path: str) -> None:
+        """
+        DataFrameをUTF-8のCSVファイルに書き出し
+
+        pyarrowがインストールされていればその高速なCSVライターを使い,
+        無ければpandasのto_csvで書き出す
+
+        Args:
+            df (pd.DataFrame): 保存するDataFrame
+            file_path (str): 出力ファイルのパス
+        """
+        if pa is not None:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), file_path)
+        else:
+            df.to_csv(file_path, index=False, encoding="utf-8")
+
+    def _save_json(self, df: pd.DataFrame, summaries: Dict[str, pd.DataFrame], output_dir: str) -> None:
         """
         JSON形式で保存
 
         Args:
             df (pd.DataFrame): 保存するDataFrame
+            summaries (Dict[str, pd.DataFrame]): _create_summariesで作成した集計データ
             output_dir (str): 出力ディレクトリ
         """
         json_dir = os.path.join(output_dir, "json")
@@ -529,28 +864,44 @@ class CafeDataGenerator:
         }
 
         main_file = os.path.join(json_dir, "cafe_sales_data.json")
-        with open(main_file, "w", encoding="utf-8") as f:
-            json.dump(main_data, f, ensure_ascii=False, indent=2, default=str)
+        self._write_json(main_data, main_file)
 
         # 集計データをJSON形式で保存
-        summaries = {
-            "daily_summary": self._create_daily_summary(df).to_dict("records"),
-            "product_summary": self._create_product_summary(df).to_dict("records"),
-            "customer_summary": self._create_customer_summary(df).to_dict("records"),
+        summary_data = {
+            name: summaries[name].to_dict("records")
+            for name in ["daily_summary", "product_summary", "customer_summary"]
         }
 
         summary_file = os.path.join(json_dir, "summaries.json")
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summaries, f, ensure_ascii=False, indent=2, default=str)
+        self._write_json(summary_data, summary_file)
 
         print(f"  ✅ JSON保存完了: {json_dir}")
 
-    def _save_xlsx(self, df: pd.DataFrame, output_dir: str) -> None:
+    def _write_json(self, data: Any, file_path: str) -> None:
+        """
+        データをインデント付きのUTF-8のJSONファイルに書き出し
+
+        orjsonがインストールされていればそれを使い, 無ければ標準のjsonで書き出す
+        （どちらも日本語はエスケープせず, 変換できない値は文字列にする）
+
+        Args:
+            data (Any): 保存するデータ
+            file_path (str): 出力ファイルのパス
+        """
+        if orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+
+    def _save_xlsx(self, df: pd.DataFrame, summaries: Dict[str, pd.DataFrame], output_dir: str) -> None:
         """
         Excel形式で保存
 
         Args:
             df (pd.DataFrame): 保存するDataFrame
+            summaries (Dict[str, pd.DataFrame]): _create_summariesで作成した集計データ
             output_dir (str): 出力ディレクトリ
         """
         try:
@@ -560,31 +911,68 @@ class CafeDataGenerator:
             # 複数シートを持つExcelファイルを作成
             excel_file = os.path.join(xlsx_dir, "cafe_sales_analysis.xlsx")
 
-            with pd.ExcelWriter(excel_file, engine="openpyxl") as writer:
+            # xlsxwriterでは文字列ごとのURL判定を省く（商品名などにURLは含まれない）
+            engine_kwargs: Dict[str, Any] = (
+                {"options": {"strings_to_urls": False}} if EXCEL_ENGINE == "xlsxwriter" else {}
+            )
+
+            with pd.ExcelWriter(excel_file, engine=EXCEL_ENGINE, engine_kwargs=engine_kwargs) as writer:
                 # メインデータ
                 df.to_excel(writer, sheet_name="売上データ", index=False)
 
                 # 各種集計データ
-                daily_summary = self._create_daily_summary(df)
-                daily_summary.to_excel(writer, sheet_name="日別集計", index=False)
-
-                product_summary = self._create_product_summary(df)
-                product_summary.to_excel(writer, sheet_name="商品別集計", index=False)
-
-                customer_summary = self._create_customer_summary(df)
-                customer_summary.to_excel(writer, sheet_name="顧客分析", index=False)
+                summaries["daily_summary"].to_excel(writer, sheet_name="日別集計", index=False)
+                summaries["product_summary"].to_excel(writer, sheet_name="商品別集計", index=False)
+                summaries["customer_summary"].to_excel(writer, sheet_name="顧客分析", index=False)
 
                 # 性別・年代別分析
-                demographic_analysis = self._create_demographic_analysis(df)
-                demographic_analysis.to_excel(writer, sheet_name="性別年代分析", index=False)
+                summaries["demographic_analysis"].to_excel(writer, sheet_name="性別年代分析", index=False)
 
             print(f"  ✅ XLSX保存完了: {xlsx_dir}")
 
         except ImportError:
-            print("  ⚠️  XLSX保存にはopenpyxlが必要です。pip install openpyxlを実行してください。")
+            print("  ⚠️  XLSX保存にはxlsxwriterまたはopenpyxlが必要です。pip install xlsxwriterを実行してください。")
         except Exception as e:
             print(f"  ❌ XLSX保存エラー: {e}")
 
+    def _save_parquet(self, df: pd.DataFrame, summaries: Dict[str, pd.DataFrame], output_dir: str) -> None:
+        """
+        Parquet形式で保存
+
+        列指向・圧縮・型情報付きの形式のため, 大きな売上データの保存と再読み込みに向いている
+
+        Args:
+            df (pd.DataFrame): 保存するDataFrame
+            summaries (Dict[str, pd.DataFrame]): _create_summariesで作成した集計データ
+            output_dir (str): 出力ディレクトリ
+        """
+        try:
+            parquet_dir = os.path.join(output_dir, "parquet")
+            os.makedirs(parquet_dir, exist_ok=True)
+
+            # メイン売上データ（後から条件で絞り込みやすいよう行グループを分割）
+            main_file = os.path.join(parquet_dir, "cafe_sales_data.parquet")
+            df.to_parquet(
+                main_file,
+                engine="pyarrow",
+                index=False,
+                compression="zstd",
+                compression_level=3,
+                row_group_size=100000,
+            )
+
+            # 集計データ
+            for name in ["daily_summary", "product_summary", "customer_summary"]:
+                summary_file = os.path.join(parquet_dir, f"{name}.parquet")
+                summaries[name].to_parquet(summary_file, engine="pyarrow", index=False, compression="zstd")
+
+            print(f"  ✅ Parquet保存完了: {parquet_dir}")
+
+        except ImportError:
+            print("  ⚠️  Parquet保存にはpyarrowが必要です。pip install pyarrowを実行してください。")
+        except Exception as e:
+            print(f"  ❌ Parquet保存エラー: {e}")
+
     def _create_daily_summary(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         日別集計データを作成
@@ -596,16 +984,12 @@ class CafeDataGenerator:
             pd.DataFrame: 日別に集計されたDataFrame
         """
         try:
-            daily_summary = (
-                df.groupby(["日付", "曜日", "天気", "季節", "平日休日"])
-                .agg(
-                    {
-                        "単価": ["count", "sum", "mean"],
-                        "利益": "sum",
-                        "顧客ID": "nunique",
-                    }
-                )
-                .round(2)
+            daily_summary = df.groupby(["日付", "曜日", "天気", "季節", "平日休日"], observed=True, sort=False).agg(
+                {
+                    "単価": ["count", "sum", "mean"],
+                    "利益": "sum",
+                    "顧客ID": "nunique",
+                }
             )
 
             # カラム名を平坦化
@@ -618,21 +1002,20 @@ class CafeDataGenerator:
                     "ユニーク顧客数",
                 ]
             )
+            # 小数になる平均の列だけを丸める
+            daily_summary = daily_summary.round({"平均単価": 2})
 
-            return daily_summary.reset_index()
+            # 集計はキーを並べ替えずに行い, 件数の少ない集計結果だけを並べ替える
+            return daily_summary.sort_index().reset_index()
 
         except Exception as e:
             print(f"日別集計作成エラー: {e}")
             # エラー時は基本的な集計を返す
-            fallback = (
-                df.groupby("日付")
-                .agg(
-                    {
-                        "単価": ["count", "sum"],
-                        "利益": "sum",
-                    }
-                )
-                .round(2)
+            fallback = df.groupby("日付", observed=True).agg(
+                {
+                    "単価": ["count", "sum"],
+                    "利益": "sum",
+                }
             )
             fallback.columns = pd.Index(["注文件数", "売上合計", "利益合計"])
             return fallback.reset_index()
@@ -648,19 +1031,17 @@ class CafeDataGenerator:
             pd.DataFrame: 商品別に集計されたDataFrame
         """
         try:
-            product_summary = (
-                df.groupby(["商品名", "カテゴリ"])
-                .agg(
-                    {
-                        "単価": ["count", "mean"],
-                        "利益": ["sum", "mean"],
-                    }
-                )
-                .round(2)
+            # 販売回数が同じ商品の並び順が変わらないよう, この集計はグループを並び替えたまま行う
+            product_summary = df.groupby(["商品名", "カテゴリ"], observed=True).agg(
+                {
+                    "単価": ["count", "mean"],
+                    "利益": ["sum", "mean"],
+                }
             )
 
             # カラム名の平坦化
             product_summary.columns = pd.Index(["販売回数", "平均単価", "利益合計", "平均利益"])
+            product_summary = product_summary.round({"平均単価": 2, "平均利益": 2})
             product_summary = product_summary.reset_index()
 
             return product_summary.sort_values("販売回数", ascending=False)
@@ -668,7 +1049,7 @@ class CafeDataGenerator:
         except Exception as e:
             print(f"商品集計作成エラー: {e}")
             # エラー時は基本的な集計を返す
-            fallback = df.groupby("商品名").agg({"単価": ["count", "sum"]}).round(2)
+            fallback = df.groupby("商品名", observed=True).agg({"単価": ["count", "sum"]})
             fallback.columns = pd.Index(["販売回数", "売上合計"])
             return fallback.reset_index()
 
@@ -683,26 +1064,23 @@ class CafeDataGenerator:
             pd.DataFrame: 顧客属性別に集計されたDataFrame
         """
         try:
-            customer_summary = (
-                df.groupby(["性別", "年代"])
-                .agg(
-                    {
-                        "単価": ["count", "sum", "mean"],
-                        "利益": "sum",
-                        "顧客ID": "nunique",
-                    }
-                )
-                .round(2)
+            customer_summary = df.groupby(["性別", "年代"], observed=True, sort=False).agg(
+                {
+                    "単価": ["count", "sum", "mean"],
+                    "利益": "sum",
+                    "顧客ID": "nunique",
+                }
             )
 
             customer_summary.columns = pd.Index(["注文回数", "売上合計", "平均単価", "利益合計", "ユニーク顧客数"])
+            customer_summary = customer_summary.round({"平均単価": 2})
 
-            return customer_summary.reset_index()
+            return customer_summary.sort_index().reset_index()
 
         except Exception as e:
             print(f"顧客分析作成エラー: {e}")
             # エラー時は基本的な集計を返す
-            fallback = df.groupby("性別").agg({"単価": ["count", "sum"]}).round(2)
+            fallback = df.groupby("性別", observed=True).agg({"単価": ["count", "sum"]})
             fallback.columns = pd.Index(["注文回数", "売上合計"])
             return fallback.reset_index()
 
@@ -717,26 +1095,22 @@ class CafeDataGenerator:
             pd.DataFrame: 性別・年代・カテゴリ別に分析されたDataFrame
         """
         try:
-            analysis = (
-                df.groupby(["性別", "年代", "カテゴリ"])
-                .agg(
-                    {
-                        "単価": ["count", "sum"],
-                        "顧客ID": "nunique",
-                    }
-                )
-                .round(2)
+            analysis = df.groupby(["性別", "年代", "カテゴリ"], observed=True, sort=False).agg(
+                {
+                    "単価": ["count", "sum"],
+                    "顧客ID": "nunique",
+                }
             )
 
             # カラム名を平坦化
             analysis.columns = pd.Index(["注文回数", "売上", "顧客数"])
 
-            return analysis.reset_index()
+            return analysis.sort_index().reset_index()
 
         except Exception as e:
             print(f"性別年代分析作成エラー: {e}")
             # エラー時は基本的な集計を返す
-            fallback = df.groupby(["性別", "カテゴリ"]).agg({"単価": "count"}).round(2)
+            fallback = df.groupby(["性別", "カテゴリ"], observed=True).agg({"単価": "count"})
             fallback.columns = pd.Index(["注文回数"])
             return fallback.reset_index()
 
@@ -751,11 +1125,15 @@ class CafeDataGenerator:
         print("📊 カフェ売上データの概要")
         print("=" * 60)
 
+        # 売上・利益の合計は1回の集計でまとめて求め, 平均単価は売上合計から計算する
+        totals: pd.Series = df[["単価", "利益"]].sum()
+        average_price: float = totals["単価"] / len(df) if len(df) > 0 else float("nan")
+
         print(f"📅 データ期間: {df['日付'].min()} ～ {df['日付'].max()}")
         print(f"📈 総レコード数: {len(df):,}件")
-        print(f"💰 総売上: ¥{df['単価'].sum():,}")
-        print(f"💵 総利益: ¥{df['利益'].sum():,}")
-        print(f"🏪 平均単価: ¥{df['単価'].mean():.0f}")
+        print(f"💰 総売上: ¥{totals['単価']:,}")
+        print(f"💵 総利益: ¥{totals['利益']:,}")
+        print(f"🏪 平均単価: ¥{average_price:.0f}")
         print(f"👥 ユニーク顧客数: {df['顧客ID'].nunique():,}人")
 
         print(f"\n👫 性別分布:")
@@ -771,7 +1149,7 @@ class CafeDataGenerator:
             print(f"  {age}: {count:,}件 ({percentage:.1f}%)")
 
         print(f"\n📊 カテゴリ別売上:")
-        category_sales = df.groupby("カテゴリ")["単価"].sum().sort_values(ascending=False)
+        category_sales = df.groupby("カテゴリ", observed=True, sort=False)["単価"].sum().sort_values(ascending=False)
         for category, sales in category_sales.items():
             print(f"  {category}: ¥{sales:,}")
 
@@ -808,6 +1186,7 @@ def main() -> None:
         print("1. data/csv/ フォルダでCSVファイルを確認")
         print("2. data/json/ フォルダでJSON形式を確認")
         print("3. data/xlsx/ フォルダでExcelファイルを開いて分析")
+        print("   （大きなデータは data/parquet/ を pd.read_parquet で読み込むと高速です）")
         print("4. 顧客の性別・年代別の購買傾向を分析してみましょう")
 
         print("\n🔍 分析のヒント:")